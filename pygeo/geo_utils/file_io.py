@@ -29,6 +29,29 @@ def writeValues(handle, values, dtype, binary=False):
             values.tofile(handle, sep=" ", format="%d")
 
 
+def formatTecplot1DHeader(name, nx, solutionTime=None):
+    """Format the zone header of a 1D point-packed tecplot zone with nx points"""
+    header = 'Zone T="%s" I=%d\n' % (name, nx)
+    if solutionTime is not None:
+        header += "SOLUTIONTIME=%f\n" % solutionTime
+    header += "DATAPACKING=POINT\n"
+    return header
+
+
+def formatTecplotPoints(data):
+    """Format an (N, nDim) array as point-packed tecplot rows in a single string"""
+    nx, nDim = data.shape
+    rowFmt = "%f " * nDim + "\n"
+    return (rowFmt * nx) % tuple(data.ravel().tolist())
+
+
+def formatTecplot1D(name, data, solutionTime=None):
+    """Format a 1D point-packed tecplot zone as a single string. The output
+    matches pyspline's writeTecplot1D, but is built in one pass so it can be
+    written to the file handle with a single call"""
+    return formatTecplot1DHeader(name, data.shape[0], solutionTime) + formatTecplotPoints(data)
+
+
 def readAirfoilFile(fileName, bluntTe=False, bluntTaperRange=0.1, bluntThickness=0.002):
     """Load the airfoil file"""
     f = open(fileName)
@@ -8,7 +8,6 @@ Enables the use of different geometry parameterizations (FFD, OpenVSP, ESP, etc)
 # Standard Python modules
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-import copy
 
 
 class BaseDVGeometry(ABC):
@@ -203,14 +202,11 @@ class BaseDVGeometry(ABC):
         dict
             The mapped DVs in the same dictionary format
         """
-        # first make a copy so we don't modify in place
-        inDictBase = inDict
         userVec = inDict[self.DVComposite.name]
         outVec = self.mapVecToDVGeo(userVec)
         outDict = self.convertSensitivityToDict(outVec.reshape(1, -1), out1D=True, useCompositeNames=False)
         # now merge inDict and outDict
-        for key in inDict:
-            outDict[key] = inDictBase[key]
+        outDict.update(inDict)
         return outDict
 
     def mapXDictToComp(self, inDict):
@@ -227,8 +223,7 @@ class BaseDVGeometry(ABC):
         dict
             The mapped DVs
         """
-        # first make a copy so we don't modify in place
-        inDict = copy.deepcopy(inDict)
+        # inDict is only read from, so there is no need to copy it here
         userVec = self.convertDictToSensitivity(inDict)
         outVec = self.mapVecToComp(userVec)
         outDict = self.convertSensitivityToDict(outVec.reshape(1, -1), out1D=True, useCompositeNames=True)
@@ -250,7 +245,7 @@ class BaseDVGeometry(ABC):
         """
         inVec = inVec.reshape(self.getNDV(), -1)
         outVec = self.DVComposite.u @ inVec
-        return outVec.flatten()
+        return outVec.ravel()
 
     def mapVecToComp(self, inVec):
         """
@@ -268,7 +263,7 @@ class BaseDVGeometry(ABC):
         """
         inVec = inVec.reshape(self.getNDV(), -1)
         outVec = self.DVComposite.u.transpose() @ inVec
-        return outVec.flatten()
+        return outVec.ravel()
 
     def mapSensToComp(self, inVec):
         """
@@ -3538,16 +3538,16 @@ class DVGeometry(BaseDVGeometry):
 
     def _setInitialValues(self):
         if len(self.axis) > 0:
-            self.coef[:, :] = copy.deepcopy(self.coef0)
+            self.coef[:, :] = self.coef0
             for key in self.axis:
-                self.scale[key].coef[:] = copy.deepcopy(self.scale0[key].coef)
-                self.scale_x[key].coef[:] = copy.deepcopy(self.scale_x0[key].coef)
-                self.scale_y[key].coef[:] = copy.deepcopy(self.scale_y0[key].coef)
-                self.scale_z[key].coef[:] = copy.deepcopy(self.scale_z0[key].coef)
-                self.rot_x[key].coef[:] = copy.deepcopy(self.rot_x0[key].coef)
-                self.rot_y[key].coef[:] = copy.deepcopy(self.rot_y0[key].coef)
-                self.rot_z[key].coef[:] = copy.deepcopy(self.rot_z0[key].coef)
-                self.rot_theta[key].coef[:] = copy.deepcopy(self.rot_theta0[key].coef)
+                self.scale[key].coef[:] = self.scale0[key].coef
+                self.scale_x[key].coef[:] = self.scale_x0[key].coef
+                self.scale_y[key].coef[:] = self.scale_y0[key].coef
+                self.scale_z[key].coef[:] = self.scale_z0[key].coef
+                self.rot_x[key].coef[:] = self.rot_x0[key].coef
+                self.rot_y[key].coef[:] = self.rot_y0[key].coef
+                self.rot_z[key].coef[:] = self.rot_z0[key].coef
+                self.rot_theta[key].coef[:] = self.rot_theta0[key].coef
 
     def _getRotMatrix(self, rotX, rotY, rotZ, rotType):
         if rotType == 1:
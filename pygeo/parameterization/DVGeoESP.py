@@ -1358,8 +1358,9 @@ class DVGeometryESP(DVGeoSketch):
                     # Step size for this particular DV
                     dh = dvObj.dh
 
-                    # Perturb the DV
-                    dvSave = dvObj.value.copy()
+                    # Perturb a copy of the DV, so that arrays returned by getValues() are not modified
+                    dvSave = dvObj.value
+                    dvObj.value = dvSave.copy()
                     dvObj.value[dvLocalIndex] += dh
 
                     # update the esp model
@@ -1380,7 +1381,7 @@ class DVGeometryESP(DVGeoSketch):
                     ptsNew[i, :, :] = (ptsNew[i, :, :] - pts0[:, :]) / dh
 
                     # Reset the DV
-                    dvObj.value = dvSave.copy()
+                    dvObj.value = dvSave
 
                     # increment the counter
                     i += 1
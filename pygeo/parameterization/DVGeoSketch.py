@@ -8,14 +8,14 @@ Enables the use of ESP (Engineering Sketch Pad) and OpenVSP (Open Vehicle Sketch
 
 # Standard Python modules
 from abc import abstractmethod
-from collections import OrderedDict
 
 # External modules
 from mpi4py import MPI
 import numpy as np
-from pyspline.utils import closeTecplot, openTecplot, writeTecplot1D
+from pyspline.utils import closeTecplot, openTecplot
 
 # Local modules
+from ..geo_utils import formatTecplot1D, formatTecplot1DHeader, formatTecplotPoints
 from .BaseDVGeo import BaseDVGeometry
 from .designVars import geoDVComposite
 
@@ -77,7 +77,7 @@ class DVGeoSketch(BaseDVGeometry):
         self.comm = comm
 
         # Initial list of DVs
-        self.DVs = OrderedDict()
+        self.DVs = {}
 
     def addCompositeDV(self, dvName, ptSetName=None, u=None, scale=None, comm=None):
         """
@@ -133,14 +133,24 @@ class DVGeoSketch(BaseDVGeometry):
         variables. Values are returned in a dictionary format
         that would be suitable for a subsequent call to setValues()
 
+        Without composite DVs, the arrays are read-only views of the
+        internal DV values. The internal values are always replaced rather
+        than modified in place, so the views keep the values from the time
+        of this call and do not need to be copied by the caller.
+        To modify a design, build new arrays and pass them to setDesignVars().
+        With composite DVs, the composite values are computed from the
+        internal DVs and returned as new, writeable arrays.
+
         Returns
         -------
         dvDict : dict
             Dictionary of design variables
         """
-        dvDict = OrderedDict()
-        for dvName in self.DVs:
-            dvDict[dvName] = self.DVs[dvName].value
+        dvDict = {}
+        for dvName, dv in self.DVs.items():
+            value = dv.value.view()
+            value.flags.writeable = False
+            dvDict[dvName] = value
 
         if self.useComposite:
             dvDict = self.mapXDictToComp(dvDict)
@@ -185,8 +195,7 @@ class DVGeoSketch(BaseDVGeometry):
 
         dIdx = np.zeros(DVCount, dtype="d")
         i = 0
-        for key in self.DVs:
-            dv = self.DVs[key]
+        for key, dv in self.DVs.items():
             dIdx[i : i + dv.nVal] = dIdxDict[key]
             i += dv.nVal
 
@@ -222,8 +231,7 @@ class DVGeoSketch(BaseDVGeometry):
 
         i = 0
         dIdxDict = {}
-        for key in self.DVs:
-            dv = self.DVs[key]
+        for key, dv in self.DVs.items():
             if out1D:
                 dIdxDict[key] = np.ravel(dIdx[:, i : i + dv.nVal])
             else:
@@ -260,16 +268,7 @@ class DVGeoSketch(BaseDVGeometry):
         if self.useComposite:
             dv = self.DVComposite
             optProb.addVarGroup(dv.name, dv.nVal, "c", value=dv.value, lower=dv.lower, upper=dv.upper, scale=dv.scale)
-            lb = {}
-            ub = {}
-
-            for dvName in self.DVs:
-                dv = self.DVs[dvName]
-                lb[dvName] = dv.lower
-                ub[dvName] = dv.upper
-
-            lb = self.convertDictToSensitivity(lb)
-            ub = self.convertDictToSensitivity(ub)
+            lb, ub = self._getBoundsVec()
 
             optProb.addConGroup(
                 f"{self.DVComposite.name}_con",
@@ -282,13 +281,11 @@ class DVGeoSketch(BaseDVGeometry):
                 jac={self.DVComposite.name: self.DVComposite.u},
             )
         else:
-            for dvName in self.DVs:
-                dv = self.DVs[dvName]
-                optProb.addVarGroup(
-                    dvName, dv.nVal, "c", value=dv.value, lower=dv.lower, upper=dv.upper, scale=dv.scale
-                )
+            addVarGroup = optProb.addVarGroup
+            for dvName, dv in self.DVs.items():
+                addVarGroup(dvName, dv.nVal, "c", value=dv.value, lower=dv.lower, upper=dv.upper, scale=dv.scale)
 
-    def writePointSet(self, name, fileName):
+    def writePointSet(self, name, fileName, parallel=False):
         """
         Write a given point set to a tecplot file
 
@@ -300,17 +297,73 @@ class DVGeoSketch(BaseDVGeometry):
         fileName : str
            Filename for tecplot file. Should have no extension, an
            extension will be added
+
+        parallel : bool
+            If True, the points owned by each processor on ``self.comm`` are
+            written collectively to a single file using MPI-IO. If the point set
+            is not distributed, every processor holds the full set, so only the
+            root processor's copy is written. Otherwise, the local points are
+            written with regular serial file I/O.
         """
         coords = self.update(name)
         fileName = fileName + "_%s.dat" % name
-        f = openTecplot(fileName, 3)
-        writeTecplot1D(f, name, coords)
-        closeTecplot(f)
+
+        if not parallel:
+            f = openTecplot(fileName, 3)
+            f.write(formatTecplot1D(name, coords))
+            closeTecplot(f)
+            return
+
+        # a non-distributed point set is duplicated on every proc, so only write it once.
+        # point sets without the flag are assumed to be distributed.
+        if not getattr(self.pointSets[name], "distributed", True) and self.comm.rank != 0:
+            coords = coords[:0]
+
+        # the root proc writes the headers for the total number of points,
+        # followed by its own points. The rest are appended in rank order.
+        nPts = self.comm.allreduce(coords.shape[0])
+        buf = formatTecplotPoints(coords)
+        if self.comm.rank == 0:
+            buf = 'VARIABLES = "X", "Y", "Z"\n' + formatTecplot1DHeader(name, nPts) + buf
+        buf = buf.encode()
+
+        offset = self.comm.exscan(len(buf))
+        if offset is None:
+            offset = 0
+
+        fh = MPI.File.Open(self.comm, fileName, MPI.MODE_WRONLY | MPI.MODE_CREATE)
+        fh.Set_size(0)
+        fh.Write_at_all(offset, [buf, MPI.CHAR])
+        fh.Close()
 
     # ----------------------------------------------------------------------- #
     #      THE REMAINDER OF THE FUNCTIONS NEED NOT BE CALLED BY THE USER      #
     # ----------------------------------------------------------------------- #
 
+    def _getBoundsVec(self):
+        """
+        Assemble the lower and upper bounds of all DVs into flat arrays of
+        length getNDV(), in the same order as convertDictToSensitivity().
+
+        Returns
+        -------
+        lb : array
+            Lower bounds of the DVs
+        ub : array
+            Upper bounds of the DVs
+        """
+        DVCount = self.getNDV()
+
+        lb = np.empty(DVCount, dtype="d")
+        ub = np.empty(DVCount, dtype="d")
+        i = 0
+        for dv in self.DVs.values():
+            lb[i : i + dv.nVal] = dv.lower
+            ub[i : i + dv.nVal] = dv.upper
+            i += dv.nVal
+
+        return lb, ub
+
     @abstractmethod
     def _updateModel(self):
         """
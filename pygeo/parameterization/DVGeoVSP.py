@@ -365,7 +365,7 @@ class DVGeometryVSP(DVGeoSketch):
         # Just dump in the values
         for key in dvDict:
             if key in self.DVs:
-                self.DVs[key].value = dvDict[key]
+                self.DVs[key].value = np.atleast_1d(dvDict[key]).astype("d")
 
         # we just need to set the design variables in the VSP model and we are done
         self._updateModel()
@@ -992,9 +992,9 @@ class DVGeometryVSP(DVGeoSketch):
                 # Step size for this particular DV
                 dh = self.DVs[dvKeys[iDV]].dh
 
-                # Perturb the DV
-                dvSave = self.DVs[dvKeys[iDV]].value.copy()
-                self.DVs[dvKeys[iDV]].value += dh
+                # Perturb the DV out of place, so that arrays returned by getValues() are not modified
+                dvSave = self.DVs[dvKeys[iDV]].value
+                self.DVs[dvKeys[iDV]].value = dvSave + dh
 
                 # update the vsp model
                 t11 = time.time()
@@ -1014,7 +1014,7 @@ class DVGeometryVSP(DVGeoSketch):
                 ptsNew[i, :, :] = (ptsNew[i, :, :] - pts0[:, :]) / dh
 
                 # Reset the DV
-                self.DVs[dvKeys[iDV]].value = dvSave.copy()
+                self.DVs[dvKeys[iDV]].value = dvSave
 
                 # increment the counter
                 i += 1
@@ -1177,3 +1177,5 @@ class PointSet:
         self.offset = self.pts - self.points
         self.nPts = len(self.pts)
         self.jac = None
+        # each proc only holds its own part of the point set
+        self.distributed = True
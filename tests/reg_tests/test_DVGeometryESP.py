@@ -240,6 +240,19 @@ class TestPyGeoESP_BasicCube(unittest.TestCase):
         for key in dvdict_cache:
             self.assertAlmostEqual(np.sum(np.abs(DVGeo.DVs[key].value - dvdict_cache[key].value)), 0.0)
 
+    def test_values_unchanged_by_finite_difference(self):
+        DVGeo, initpts = self.setup_cubemodel()
+        for designvarname in ["cubex0", "cubey0", "cubez0", "cubedx", "cubedy", "cubedz"]:
+            DVGeo.addVariable(designvarname)
+
+        # the finite differencing must not modify arrays that were already handed out
+        x = DVGeo.getValues()
+        xRef = {dvName: val.copy() for dvName, val in x.items()}
+        DVGeo._computeSurfJacobian(fd=True)
+
+        for dvName, val in x.items():
+            np.testing.assert_array_equal(val, xRef[dvName])
+
     def test_jacobian_arbitrary_added_order(self):
         # this test checks the underlying jacobian itself, not the public API
         DVGeo, initpts = self.setup_cubemodel()
@@ -585,6 +598,25 @@ class TestPyGeoESP_BasicCube_Distributed(unittest.TestCase):
         for ipt in range(npts):
             self.assertAlmostEqual(np.sum(np.abs(testjac[ipt, :, :] - analyticjac[ipt, :, :])), 0)
 
+    def test_pointset_distributed_flag(self):
+        # writePointSet(parallel=True) relies on this flag to only write non-distributed point sets once
+        DVGeo, initpts = self.setup_cubemodel()
+        self.assertTrue(DVGeo.pointSets["mypts"].distributed)
+
+        # every proc adds the same points to a separate DVGeo, since mixing both kinds is not supported
+        csmFile = os.path.join(self.input_path, "../input_files/esp/box.csm")
+        DVGeo = DVGeometryESP(csmFile)
+        allpts = np.array(
+            [
+                [-2.0, -2.0, -2.0],
+                [1.5, 1.5, 1.5],
+                [-2.0, -1.1, -1.1],
+                [1.5, -1.2, -0.1],
+            ]
+        )
+        DVGeo.addPointSet(allpts, "allpts", distributed=False, cache_projections=False)
+        self.assertFalse(DVGeo.pointSets["allpts"].distributed)
+
 
 @unittest.skipUnless(mpiInstalled and ocsmInstalled, "MPI and pyOCSM are required.")
 class TestPyGeoESP_BasicCube_Distributed_OneProcBlank(unittest.TestCase):
@@ -282,7 +282,7 @@ class RegTestPyGeoVSPSerial(unittest.TestCase):
             for x in DVs:
                 # perturb the design
                 xRef = DVs[x].copy()
-                DVs[x] += dh
+                DVs[x] = DVs[x] + dh
                 DVGeo.setDesignVars(DVs)
 
                 # get the new points
@@ -491,5 +491,57 @@ class RegTestPyGeoVSPSerial(unittest.TestCase):
             self.assertGreater(biggest_deriv, 0.005)
 
 
+@unittest.skipUnless(openvspInstalled, "requires openvsp Python API")
+class TestPyGeoVSPGetValues(unittest.TestCase):
+    N_PROCS = 1
+
+    def setUp(self):
+        self.base_path = os.path.dirname(os.path.abspath(__file__))
+
+    def setup_sphere(self):
+        vspFile = os.path.join(self.base_path, "../../input_files/simpleEll_med.vsp3")
+        DVGeo = DVGeometryVSP(vspFile)
+        for parm in ["A_Radius", "B_Radius", "C_Radius"]:
+            DVGeo.addVariable("Ellipsoid", "Design", parm, lower=0.5, upper=3.0, scale=1.0, dh=0.1)
+
+        # points on the sphere centered at x,y,z = 1, 0, 0 with radius 1
+        pts = np.array([[2.0, 0.0, 0.0], [1.0, 1.0, 0.0], [1.0, 0.0, 1.0]])
+        DVGeo.addPointSet(pts, "test_points")
+
+        return DVGeo, pts
+
+    def test_read_only_round_trip(self):
+        DVGeo, pts = self.setup_sphere()
+
+        x = DVGeo.getValues()
+        for val in x.values():
+            self.assertFalse(val.flags.writeable)
+        with self.assertRaises(ValueError):
+            x["Ellipsoid:Design:A_Radius"] += 1.0
+
+        # passing the read-only values back in must not make the DVs read-only
+        DVGeo.setDesignVars(x)
+        for dv in DVGeo.DVs.values():
+            self.assertTrue(dv.value.flags.writeable)
+
+        DVGeo._computeSurfJacobian()
+        self.assertEqual(DVGeo.pointSets["test_points"].jac.shape, (3 * len(pts), DVGeo.getNDV()))
+
+        # the DVs are reset after the finite differencing
+        for dvName, val in DVGeo.getValues().items():
+            np.testing.assert_array_equal(val, x[dvName])
+
+    def test_values_unchanged_by_finite_difference(self):
+        DVGeo, pts = self.setup_sphere()
+
+        # the finite differencing must not modify arrays that were already handed out
+        x = DVGeo.getValues()
+        xRef = {dvName: val.copy() for dvName, val in x.items()}
+        DVGeo._computeSurfJacobian()
+
+        for dvName, val in x.items():
+            np.testing.assert_array_equal(val, xRef[dvName])
+
+
 if __name__ == "__main__":
     unittest.main()
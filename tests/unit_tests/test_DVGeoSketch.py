@@ -0,0 +1,222 @@
+# Standard Python modules
+import os
+import tempfile
+import unittest
+
+# External modules
+from mpi4py import MPI
+import numpy as np
+from pyspline.utils import closeTecplot, openTecplot, writeTecplot1D
+
+# First party modules
+from pygeo.parameterization.designVars import geoDV
+from pygeo.parameterization.DVGeoSketch import DVGeoSketch
+
+
+class DummyPointSet:
+    def __init__(self, points, distributed):
+        self.points = points
+        self.nPts = len(points)
+        self.distributed = distributed
+        self.jac = None
+
+
+class DummyDVGeo(DVGeoSketch):
+    """
+    Minimal DVGeoSketch that does not depend on a geometry engine.
+    Point sets are returned unchanged by update().
+    """
+
+    def __init__(self, comm=MPI.COMM_WORLD):
+        super().__init__("dummy", comm=comm)
+        self.useComposite = False
+
+    def addPointSet(self, points, ptName, distributed=True):
+        self.pointSets[ptName] = DummyPointSet(np.atleast_2d(points), distributed)
+        self.updated[ptName] = False
+        self.updatedJac[ptName] = False
+
+    def addVariable(self, dvName, value, lower=None, upper=None, scale=1.0):
+        value = np.atleast_1d(np.array(value, dtype="d"))
+        self.DVs[dvName] = geoDV(dvName, value, len(value), lower, upper, scale)
+
+    def getNDV(self):
+        return sum(dv.nVal for dv in self.DVs.values())
+
+    def setDesignVars(self, dvDict):
+        for key in dvDict:
+            if key in self.DVs:
+                self.DVs[key].value = np.atleast_1d(dvDict[key]).astype("d")
+
+    def totalSensitivity(self, dIdpt, ptSetName, comm=None):
+        pass
+
+    def totalSensitivityProd(self, vec, ptSetName):
+        pass
+
+    def update(self, ptSetName):
+        self.updated[ptSetName] = True
+        return self.pointSets[ptSetName].points
+
+    def _updateModel(self):
+        pass
+
+    def _updateProjectedPts(self):
+        pass
+
+    def _computeSurfJacobian(self):
+        pass
+
+
+class TestGetValues(unittest.TestCase):
+    N_PROCS = 1
+
+    def test_read_only(self):
+        DVGeo = DummyDVGeo()
+        DVGeo.addVariable("a", [1.0, 2.0])
+        DVGeo.addVariable("b", 0.5)
+
+        dvDict = DVGeo.getValues()
+        for val in dvDict.values():
+            self.assertFalse(val.flags.writeable)
+        with self.assertRaises(ValueError):
+            dvDict["a"] += 1.0
+
+        # the internal values are unchanged and still writeable
+        np.testing.assert_array_equal(DVGeo.DVs["a"].value, [1.0, 2.0])
+        self.assertTrue(DVGeo.DVs["a"].value.flags.writeable)
+
+        # the values follow later changes to the design
+        DVGeo.setDesignVars({"a": dvDict["a"] + 1.0})
+        np.testing.assert_array_equal(DVGeo.getValues()["a"], [2.0, 3.0])
+
+    def test_composite(self):
+        DVGeo = DummyDVGeo()
+        DVGeo.addVariable("a", 1.0)
+        DVGeo.addVariable("b", 2.0)
+        DVGeo.addVariable("c", 0.5)
+        DVGeo.addCompositeDV("comp", u=np.eye(3), scale=1.0)
+
+        # composite values are new arrays, so they are writeable
+        dvDict = DVGeo.getValues()
+        self.assertEqual(list(dvDict.keys()), ["comp"])
+        self.assertTrue(dvDict["comp"].flags.writeable)
+        np.testing.assert_array_equal(dvDict["comp"], [[1.0, 2.0, 0.5]])
+
+
+class DummyOptProb:
+    """Records the calls made by addVariablesPyOpt"""
+
+    def __init__(self):
+        self.varGroups = {}
+        self.conGroups = {}
+
+    def addVarGroup(self, name, nVars, varType="c", **kwargs):
+        self.varGroups[name] = kwargs
+
+    def addConGroup(self, name, nCon, **kwargs):
+        self.conGroups[name] = kwargs
+
+
+class TestAddVariablesPyOpt(unittest.TestCase):
+    N_PROCS = 1
+
+    def test_composite_bounds(self):
+        DVGeo = DummyDVGeo()
+        DVGeo.addVariable("a", [1.0, 2.0], lower=-1.0, upper=[3.0, 4.0])
+        DVGeo.addVariable("b", 0.5, lower=-2.0, upper=2.0)
+        DVGeo.addCompositeDV("comp", u=np.eye(3), scale=1.0)
+
+        optProb = DummyOptProb()
+        DVGeo.addVariablesPyOpt(optProb)
+        con = optProb.conGroups["comp_con"]
+        np.testing.assert_array_equal(con["lower"], [-1.0, -1.0, -2.0])
+        np.testing.assert_array_equal(con["upper"], [3.0, 4.0, 2.0])
+
+        # modifying the bounds given to optProb should not affect later calls
+        con["lower"][:] = 0.0
+        optProb = DummyOptProb()
+        DVGeo.addVariablesPyOpt(optProb)
+        np.testing.assert_array_equal(optProb.conGroups["comp_con"]["lower"], [-1.0, -1.0, -2.0])
+
+        # the bounds should include DVs added later
+        DVGeo.useComposite = False
+        DVGeo.addVariable("c", 0.0, lower=-5.0, upper=5.0)
+        DVGeo.addCompositeDV("comp", u=np.eye(4), scale=1.0)
+
+        optProb = DummyOptProb()
+        DVGeo.addVariablesPyOpt(optProb)
+        con = optProb.conGroups["comp_con"]
+        np.testing.assert_array_equal(con["lower"], [-1.0, -1.0, -2.0, -5.0])
+        np.testing.assert_array_equal(con["upper"], [3.0, 4.0, 2.0, 5.0])
+
+
+class TestWritePointSetParallel(unittest.TestCase):
+    N_PROCS = 3
+
+    def setUp(self):
+        self.comm = MPI.COMM_WORLD
+        # use the same directory on every proc
+        tmpDir = tempfile.mkdtemp() if self.comm.rank == 0 else None
+        self.tmpDir = self.comm.bcast(tmpDir, root=0)
+
+    def tearDown(self):
+        self.comm.barrier()
+        if self.comm.rank == 0:
+            for fileName in os.listdir(self.tmpDir):
+                os.remove(os.path.join(self.tmpDir, fileName))
+            os.rmdir(self.tmpDir)
+
+    def check_parallel_write(self, DVGeo, refPts):
+        # write the point set collectively and compare against a serial write of refPts on the root proc
+        fileName = os.path.join(self.tmpDir, "parallel")
+        DVGeo.writePointSet("pts", fileName, parallel=True)
+        self.comm.barrier()
+
+        if self.comm.rank == 0:
+            refFileName = os.path.join(self.tmpDir, "serial_pts.dat")
+            f = openTecplot(refFileName, 3)
+            writeTecplot1D(f, "pts", refPts)
+            closeTecplot(f)
+
+            with open(fileName + "_pts.dat") as f:
+                parallelOutput = f.read()
+            with open(refFileName) as f:
+                serialOutput = f.read()
+
+            self.assertEqual(parallelOutput, serialOutput)
+
+    def test_distributed(self):
+        DVGeo = DummyDVGeo()
+
+        # a different number of points on each proc, with the last proc empty
+        nLocal = [4, 2, 0][self.comm.rank]
+        pts = np.arange(3 * nLocal, dtype="d").reshape(nLocal, 3) + 100.0 * self.comm.rank
+        DVGeo.addPointSet(pts, "pts", distributed=True)
+
+        allPts = self.comm.gather(pts, root=0)
+        if self.comm.rank == 0:
+            allPts = np.vstack(allPts)
+        self.check_parallel_write(DVGeo, allPts)
+
+    def test_nondistributed(self):
+        DVGeo = DummyDVGeo()
+
+        # the same points on every proc should only be written once
+        pts = np.arange(15, dtype="d").reshape(5, 3) * 0.5
+        DVGeo.addPointSet(pts, "pts", distributed=False)
+        self.check_parallel_write(DVGeo, pts)
+
+    def test_overwrite(self):
+        # writing a smaller point set over an existing file should not leave stale data behind
+        DVGeo = DummyDVGeo()
+        DVGeo.addPointSet(np.ones((50, 3)), "pts", distributed=False)
+        DVGeo.writePointSet("pts", os.path.join(self.tmpDir, "parallel"), parallel=True)
+
+        pts = np.zeros((2, 3))
+        DVGeo.addPointSet(pts, "pts", distributed=False)
+        self.check_parallel_write(DVGeo, pts)
+
+
+if __name__ == "__main__":
+    unittest.main()
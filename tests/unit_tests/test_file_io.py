@@ -0,0 +1,59 @@
+# Standard Python modules
+import os
+import tempfile
+import unittest
+
+# External modules
+import numpy as np
+from pyspline.utils import closeTecplot, openTecplot, writeTecplot1D
+
+# First party modules
+from pygeo.geo_utils import formatTecplot1D
+
+
+class TestFormatTecplot1D(unittest.TestCase):
+    N_PROCS = 1
+
+    def compareWithPyspline(self, data, solutionTime=None):
+        """Write data with pyspline's writeTecplot1D and with formatTecplot1D, and check the files are identical"""
+        nDim = data.shape[1]
+        with tempfile.TemporaryDirectory() as tmpDir:
+            refFile = os.path.join(tmpDir, "ref.dat")
+            f = openTecplot(refFile, nDim)
+            writeTecplot1D(f, "pts", data, solutionTime)
+            closeTecplot(f)
+
+            newFile = os.path.join(tmpDir, "new.dat")
+            f = openTecplot(newFile, nDim)
+            f.write(formatTecplot1D("pts", data, solutionTime))
+            closeTecplot(f)
+
+            with open(refFile) as f:
+                ref = f.read()
+            with open(newFile) as f:
+                new = f.read()
+
+        self.assertEqual(new, ref)
+
+    def test_3D(self):
+        data = np.random.default_rng(0).random((5, 3)) * 100.0 - 50.0
+        self.compareWithPyspline(data)
+
+    def test_empty(self):
+        self.compareWithPyspline(np.zeros((0, 3)))
+
+    def test_2D(self):
+        data = np.random.default_rng(1).random((3, 2))
+        self.compareWithPyspline(data)
+
+    def test_float32(self):
+        data = np.random.default_rng(2).random((5, 3)).astype(np.float32)
+        self.compareWithPyspline(data)
+
+    def test_solution_time(self):
+        data = np.random.default_rng(3).random((4, 3))
+        self.compareWithPyspline(data, solutionTime=1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()